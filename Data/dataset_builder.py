@@ -0,0 +1,347 @@
+import os
+import re
+import glob
+import json
+import hashlib
+from datetime import datetime
+import pandas as pd
+
+# Bump when a loader or the join logic changes so every cached node is rebuilt
+BUILDER_VERSION = 3
+
+FX_COLUMNS = [
+    'EUR_USD_Close', 'USD_JPY_Close', 'GBP_USD_Close', 'EUR_JPY_Close', 'EUR_CHF_Close',
+    'USD_CNY_Close', 'USD_INR_Close', 'USD_BRL_Close', 'USD_AUD_Close', 'USD_CAD_Close',
+    'USD_ZAR_Close', 'USD_CHF_Close', 'CNY_JPY_Close', 'USD_RUB_Close'
+]
+MACRO_COLUMNS = ['Real_GDP', 'Consumer_Price_Index', 'Unemployment_Rate', 'Inflation_Rate', 'FFRate']
+BAR_FIELDS = ['open', 'high', 'low', 'close', 'volume', 'dollar_volume']
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(DATA_DIR)
+FEATURES_DIR = os.path.join(DATA_DIR, 'features')
+
+
+def normalize_dates(df):
+    """
+    Parse the 'date' column, drop unparseable and duplicate dates, and sort by date.
+
+    Args:
+        df (DataFrame): Frame with a 'date' column.
+
+    Returns:
+        DataFrame: The cleaned frame.
+    """
+    df = df.copy()
+    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    df = df.dropna(subset=['date']).drop_duplicates(subset='date', keep='first')
+    return df.sort_values('date').reset_index(drop=True)
+
+
+def read_dated_csv(path, columns=None):
+    """
+    Load a CSV keyed by a 'date' (or 'Date') column.
+
+    Args:
+        path (str): Path to the CSV file.
+        columns (list): Columns to keep besides the date (None keeps all).
+
+    Returns:
+        DataFrame: One row per date, sorted, with a datetime 'date' column.
+    """
+    df = pd.read_csv(path)
+    df.columns = df.columns.str.strip()
+    df = df.rename(columns={'Date': 'date'})
+    if columns is not None:
+        df = df[['date'] + list(columns)]
+    return normalize_dates(df)
+
+
+def read_binance_bars(path, columns=None):
+    """
+    Load a consolidated BinanceAPI output file as per-symbol OHLCV bars.
+
+    Args:
+        path (str): Path to a Crypto-Metrics-*.csv file written by BinanceAPI.
+        columns (list): Bar columns to keep (None keeps <symbol>_<field> for BAR_FIELDS).
+
+    Returns:
+        DataFrame: One row per interval with a datetime 'date' column.
+    """
+    df = pd.read_csv(path)
+    df = df.rename(columns={'interval': 'date'})
+    if columns is None:
+        # group_data also writes <SYMBOL>_date_open, which must not be read as a symbol
+        symbols = [
+            match.group(1) for match in map(re.compile(r'^(.+)_open$').match, df.columns)
+            if match and not match.group(1).endswith('_date')
+        ]
+        if not symbols:
+            raise ValueError(f"No <SYMBOL>_open columns found in '{path}'.")
+        columns = [f"{symbol}_{field}" for symbol in symbols for field in BAR_FIELDS]
+
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing bar columns in '{path}': {', '.join(missing)}")
+    return normalize_dates(df[['date'] + list(columns)])
+
+
+class Node:
+    """
+    One source of the feature dataset: a file, how to load it and how to join it.
+    """
+
+    def __init__(self, name, path, loader=read_dated_csv, columns=None, tolerance=None, lag=None):
+        """
+        Initialize the Node class.
+
+        Args:
+            name (str): Unique node name, also used as the suffix for clashing columns.
+            path (str): Path or glob pattern of the source file. For a pattern the
+                lexicographically last match is used, so dated file names pick the newest.
+            loader (callable): Function (path, columns) -> DataFrame with a 'date' column.
+            columns (list): Columns to keep besides the date (None keeps all).
+            tolerance (str): Maximum age of a value carried forward by the as-of join
+                (e.g., '7D'); None carries values forward indefinitely.
+            lag (str): How long after its timestamp a value becomes known (e.g., '1D' for a
+                daily close stamped at 00:00). Values are shifted by this much before the
+                join so no bar sees data from its future; None applies no shift.
+        """
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self.columns = columns
+        self.tolerance = tolerance
+        self.lag = lag
+
+    def resolve_path(self):
+        """
+        Resolve the node's path or glob pattern to a single file.
+
+        Returns:
+            str: Path of the source file.
+        """
+        matches = sorted(glob.glob(self.path))
+        if not matches:
+            raise FileNotFoundError(f"No file matches '{self.path}' for node '{self.name}'.")
+        return matches[-1]
+
+    def spec(self):
+        """
+        Describe everything besides file contents that affects this node's output.
+        """
+        return json.dumps({
+            'name': self.name,
+            'loader': self.loader.__name__,
+            'columns': self.columns,
+            'tolerance': self.tolerance,
+            'lag': self.lag,
+            'builder_version': BUILDER_VERSION
+        }, sort_keys=True)
+
+
+class DatasetBuilder:
+    """
+    Build the model's feature table from source nodes, reusing unchanged work.
+
+    The first node is the spine (normally the Binance bars); every other node
+    is attached with a backward as-of join on the 'date' timestamp, so sparse
+    series such as monthly macro data or weekday-only FX closes carry forward
+    onto each daily, hourly or minute bar. A node's lag moves its values to
+    the time they become known, so intraday bars never see a daily value
+    before that day is over.
+    Each node's loaded frame is cached under its content hash, and the final
+    artifact is named after the combined hash of all nodes, so a rebuild with
+    unchanged inputs is a no-op and a daily update only reloads the files
+    that changed.
+    """
+
+    def __init__(self, nodes, cache_folder='build_cache', output_folder='features'):
+        """
+        Initialize the DatasetBuilder class.
+
+        Args:
+            nodes (list): Node objects; the first one is the spine of the join.
+            cache_folder (str): Folder for cached node frames and file hashes.
+            output_folder (str): Folder for the versioned feature artifacts.
+        """
+        names = [node.name for node in nodes]
+        if not nodes or len(set(names)) != len(names):
+            raise ValueError("Nodes must be a non-empty list with unique names.")
+
+        self.nodes = nodes
+        self.cache_folder = cache_folder
+        self.output_folder = output_folder
+        self.file_hashes_path = os.path.join(cache_folder, 'file_hashes.json')
+        self.manifest_path = os.path.join(output_folder, 'manifest.json')
+        os.makedirs(self.cache_folder, exist_ok=True)
+        os.makedirs(self.output_folder, exist_ok=True)
+        self.file_hashes = self.read_json(self.file_hashes_path)
+
+    @staticmethod
+    def read_json(path):
+        """
+        Load a JSON file, or return an empty dict if it does not exist.
+        """
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                return json.load(file)
+        return {}
+
+    @staticmethod
+    def write_json(path, data):
+        """
+        Write a JSON file atomically.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def file_hash(self, path):
+        """
+        Return the SHA-256 of a file, skipping the read when size and mtime are unchanged.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            str: Hex digest of the file contents.
+        """
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        cached = self.file_hashes.get(key)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        self.file_hashes[key] = {
+            'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()
+        }
+        return digest.hexdigest()
+
+    def node_hash(self, node, path):
+        """
+        Hash a node's source file contents together with its spec.
+        """
+        return hashlib.sha256(f"{node.spec()}|{self.file_hash(path)}".encode('utf-8')).hexdigest()
+
+    def load_node(self, node):
+        """
+        Load a node's frame, from the cache when its inputs are unchanged.
+
+        Args:
+            node (Node): The node to load.
+
+        Returns:
+            tuple: (DataFrame, content hash of the node).
+        """
+        path = node.resolve_path()
+        content_hash = self.node_hash(node, path)
+        cache_path = os.path.join(self.cache_folder, f"{node.name}-{content_hash[:16]}.pkl")
+
+        if os.path.exists(cache_path):
+            print(f"Node '{node.name}' unchanged, using cache.")
+            return pd.read_pickle(cache_path), content_hash
+
+        print(f"Loading node '{node.name}' from {path}...")
+        df = node.loader(path, node.columns)
+        df.to_pickle(cache_path)
+
+        # Drop frames cached for earlier versions of this node, but not of nodes
+        # whose names merely start with this one (e.g. 'fx' and 'fx-daily')
+        own_cache = re.compile(rf'^{re.escape(node.name)}-[0-9a-f]{{16}}\.pkl$')
+        for old_name in os.listdir(self.cache_folder):
+            old_path = os.path.join(self.cache_folder, old_name)
+            if own_cache.match(old_name) and old_path != cache_path:
+                os.remove(old_path)
+        return df, content_hash
+
+    def join(self, frames):
+        """
+        As-of join every frame onto the first one by timestamp.
+
+        Args:
+            frames (list): (Node, DataFrame) pairs; the first frame is the spine.
+
+        Returns:
+            DataFrame: The joined feature table.
+        """
+        (_, merged), rest = frames[0], frames[1:]
+        for node, df in rest:
+            if node.lag:
+                df = df.assign(date=df['date'] + pd.Timedelta(node.lag))
+            merged = pd.merge_asof(
+                merged,
+                df,
+                on='date',
+                direction='backward',
+                tolerance=pd.Timedelta(node.tolerance) if node.tolerance else None,
+                suffixes=('', f"_{node.name}")
+            )
+        return merged
+
+    def build(self):
+        """
+        Build the feature artifact, or reuse it when no node changed.
+
+        Returns:
+            str: Path of the feature artifact.
+        """
+        frames, node_hashes = [], {}
+        for node in self.nodes:
+            df, content_hash = self.load_node(node)
+            frames.append((node, df))
+            node_hashes[node.name] = content_hash
+        self.write_json(self.file_hashes_path, self.file_hashes)
+
+        # Node order is part of the version: the first node is the spine of the join
+        combined = hashlib.sha256(
+            "|".join(f"{node.name}={node_hashes[node.name]}" for node in self.nodes).encode('utf-8')
+        ).hexdigest()
+        version = combined[:12]
+        output_csv = os.path.join(self.output_folder, f"features-{version}.csv")
+
+        if os.path.exists(output_csv):
+            print(f"Feature artifact {output_csv} is up to date.")
+        else:
+            features = self.join(frames)
+            # Keep the short date format for daily spines so the model's date parser still applies
+            if (features['date'] == features['date'].dt.normalize()).all():
+                date_format = '%Y-%m-%d'
+            else:
+                date_format = '%Y-%m-%d %H:%M:%S'
+            tmp_path = f"{output_csv}.tmp"
+            features.to_csv(tmp_path, index=False, date_format=date_format)
+            os.replace(tmp_path, output_csv)
+            print(f"Saved {len(features)} rows x {features.shape[1]} columns to {output_csv}")
+
+        manifest = self.read_json(self.manifest_path)
+        manifest['latest'] = os.path.basename(output_csv)
+        manifest.setdefault('versions', {})[version] = {
+            'file': os.path.basename(output_csv),
+            'built_at': manifest.get('versions', {}).get(version, {}).get(
+                'built_at', datetime.now().isoformat(timespec='seconds')),
+            'nodes': node_hashes
+        }
+        self.write_json(self.manifest_path, manifest)
+        return output_csv
+
+
+if __name__ == "__main__":
+    # BinanceAPI.py writes its output folder into the directory it is run from (the repository root)
+    nodes = [
+        Node('binance', os.path.join(REPO_DIR, 'BTCUSDT_ETHUSDT_AVAXUSDT', 'Crypto-Metrics-*-daily.csv'),
+             loader=read_binance_bars),
+        Node('fx', os.path.join(DATA_DIR, 'final-dataset.csv'), columns=FX_COLUMNS, tolerance='7D', lag='1D'),
+        Node('macro', os.path.join(DATA_DIR, 'final-dataset.csv'), columns=MACRO_COLUMNS, lag='1D'),
+        Node('trends', os.path.join(DATA_DIR, 'pytrends', 'trend_data.csv'), tolerance='7D', lag='1D'),
+        Node('serp', os.path.join(DATA_DIR, 'serp', 'serp_trends.csv'), tolerance='7D', lag='1D'),
+    ]
+
+    builder = DatasetBuilder(nodes, cache_folder=os.path.join(DATA_DIR, 'build_cache'),
+                             output_folder=FEATURES_DIR)
+    builder.build()
@@ -0,0 +1,63 @@
+import hashlib
+from datetime import datetime, timedelta
+
+
+class StubGoogleSearch:
+    """
+    Offline stand-in for serpapi.GoogleSearch used by the trends puller.
+
+    Mirrors the parts of the GoogleSearch interface the puller relies on
+    (construction from a params dict and get_dict()) and returns a
+    deterministic google_trends TIMESERIES payload, so pulls can be run
+    and checked without an API key or network access.
+    """
+
+    # Every instance records the params it was built with, so callers can
+    # count how many "API calls" a run would have cost.
+    calls = []
+
+    def __init__(self, params):
+        """
+        Initialize the stub search.
+
+        Args:
+            params (dict): The SerpApi request parameters.
+        """
+        self.params = dict(params)
+        StubGoogleSearch.calls.append(self.params)
+
+    @classmethod
+    def reset(cls):
+        """
+        Forget all recorded calls.
+        """
+        cls.calls = []
+
+    def get_dict(self):
+        """
+        Build a fake interest-over-time response for the requested range.
+
+        Returns:
+            dict: A response shaped like SerpApi's google_trends output.
+        """
+        query = self.params["q"]
+        start, end = self.params["date"].split(" ")
+        current = datetime.strptime(start, "%Y-%m-%d")
+        end = datetime.strptime(end, "%Y-%m-%d")
+
+        timeline_data = []
+        while current <= end:
+            day = current.strftime("%Y-%m-%d")
+            digest = hashlib.md5(f"{query}|{day}".encode("utf-8")).digest()
+            value = digest[0] % 101  # Trends scores are scaled 0-100
+            timeline_data.append({
+                "date": current.strftime("%b %d, %Y"),
+                "timestamp": str(int((current - datetime(1970, 1, 1)).total_seconds())),
+                "values": [{"query": query, "value": str(value), "extracted_value": value}]
+            })
+            current += timedelta(days=1)
+
+        return {
+            "search_parameters": self.params,
+            "interest_over_time": {"timeline_data": timeline_data}
+        }
@@ -0,0 +1,284 @@
+import os
+import re
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+
+SERP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_FOLDER = os.path.join(SERP_DIR, "serp_cache")
+DEFAULT_OUTPUT_CSV = os.path.join(SERP_DIR, "serp_trends.csv")
+
+
+class SerpTrendsPuller:
+    """
+    Pull Google Trends interest-over-time for many keywords through SerpApi.
+
+    Every (keyword, date chunk) pair is one API request. Requests run on a
+    thread pool, raw JSON responses are cached on disk, and a re-run only
+    pays for the chunks that are not cached yet, so an interrupted pull can
+    simply be started again.
+    """
+
+    # Google Trends only returns daily resolution for spans shorter than ~270 days
+    CHUNK_DAYS = 30 * 8
+
+    def __init__(self, keywords, date_ranges=None, api_key=None, max_workers=4,
+                 max_requests=None, cache_folder=DEFAULT_CACHE_FOLDER, search_class=None):
+        """
+        Initialize the SerpTrendsPuller class.
+
+        Args:
+            keywords (list): Search keywords (e.g., ['crypto crash', 'buy AVAX']).
+            date_ranges (list): (start, end) pairs in 'YYYY-MM-DD' format. Overlapping pairs
+                are merged, then split into chunks of at most CHUNK_DAYS days.
+            api_key (str): SerpApi key. Defaults to the SERPAPI_KEY environment variable.
+            max_workers (int): Number of requests in flight at once.
+            max_requests (int): Maximum number of uncached API calls for this run
+                (None for no limit). Chunks over budget are skipped and picked up on the next run.
+            cache_folder (str): Folder holding the raw JSON responses.
+            search_class (type): Class implementing the GoogleSearch interface. Defaults to
+                serpapi.GoogleSearch; pass StubGoogleSearch to run offline.
+        """
+        self.keywords = list(dict.fromkeys(keywords))  # Drop duplicates, keep order
+        self.date_ranges = date_ranges or [("2020-09-19", "2024-12-06")]
+        self.api_key = api_key or os.environ.get("SERPAPI_KEY", "")
+        self.max_workers = max_workers
+        self.max_requests = max_requests
+        self.cache_folder = cache_folder
+        self.search_class = search_class
+        self.chunks = self.generate_chunks()
+
+        self.requests_made = 0
+        self.budget_lock = threading.Lock()
+        os.makedirs(self.cache_folder, exist_ok=True)
+
+    def generate_chunks(self):
+        """
+        Merge the requested date ranges and split them into API-sized chunks.
+
+        Overlapping or adjacent ranges are merged first, so no day is requested
+        twice and every day gets its score from exactly one request.
+
+        Returns:
+            list: Sorted, non-overlapping (start, end) date string pairs.
+        """
+        ranges = []
+        for start_date, end_date in self.date_ranges:
+            start = datetime.strptime(start_date, "%Y-%m-%d")
+            end = datetime.strptime(end_date, "%Y-%m-%d")
+            if start > end:
+                raise ValueError(f"Invalid date range: {start_date} is after {end_date}.")
+            ranges.append((start, end))
+
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        chunks = []
+        for current, end in merged:
+            while current <= end:
+                chunk_end = min(current + timedelta(days=self.CHUNK_DAYS), end)
+                chunks.append((current.strftime("%Y-%m-%d"), chunk_end.strftime("%Y-%m-%d")))
+                current = chunk_end + timedelta(days=1)
+        return chunks
+
+    def cache_path(self, keyword, start, end):
+        """
+        Build the cache file path for one (keyword, range) request.
+
+        Args:
+            keyword (str): The search keyword.
+            start (str): Range start in 'YYYY-MM-DD' format.
+            end (str): Range end in 'YYYY-MM-DD' format.
+
+        Returns:
+            str: Path of the cached JSON response.
+        """
+        # Readable slug plus a short digest so 'buy btc' and 'buy_btc' never collide
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", keyword).strip("-") or "keyword"
+        digest = hashlib.md5(keyword.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.cache_folder, f"{slug}-{digest}_{start}_{end}.json")
+
+    def build_params(self, keyword, start, end):
+        """
+        Build the SerpApi request parameters for one (keyword, range) request.
+
+        Returns:
+            dict: The google_trends TIMESERIES request parameters.
+        """
+        return {
+            "api_key": self.api_key,
+            "engine": "google_trends",
+            "q": keyword,
+            "data_type": "TIMESERIES",
+            "cat": "0",
+            "date": f"{start} {end}",
+            "csv": "false",
+            "include_low_search_volume": "true"
+        }
+
+    def take_request(self):
+        """
+        Reserve one API call from the request budget.
+
+        Returns:
+            bool: True if the call may be made, False if the budget is spent.
+        """
+        with self.budget_lock:
+            if self.max_requests is not None and self.requests_made >= self.max_requests:
+                return False
+            self.requests_made += 1
+            return True
+
+    def fetch(self, keyword, start, end):
+        """
+        Return the raw response for one request, from the cache when possible.
+
+        Args:
+            keyword (str): The search keyword.
+            start (str): Range start in 'YYYY-MM-DD' format.
+            end (str): Range end in 'YYYY-MM-DD' format.
+
+        Returns:
+            dict: The raw SerpApi response, or None if it could not be fetched.
+        """
+        path = self.cache_path(keyword, start, end)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                return json.load(file)
+
+        if not self.take_request():
+            print(f"Request budget spent, skipping '{keyword}' {start} to {end}.")
+            return None
+
+        try:
+            print(f"Fetching '{keyword}' from {start} to {end}...")
+            results = self.search_class(self.build_params(keyword, start, end)).get_dict()
+        except Exception as e:
+            print(f"Error fetching '{keyword}' from {start} to {end}: {e}")
+            return None
+
+        if "error" in results or "interest_over_time" not in results:
+            print(f"No data for '{keyword}' from {start} to {end}: {results.get('error', 'empty response')}")
+            return None
+
+        # Write to a temporary file first so a crash never leaves a truncated cache entry
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(results, file)
+        os.replace(tmp_path, path)
+        return results
+
+    @staticmethod
+    def parse_timeline(results, keyword):
+        """
+        Extract the daily scores from a raw response.
+
+        Args:
+            results (dict): The raw SerpApi response.
+            keyword (str): The search keyword.
+
+        Returns:
+            DataFrame: Columns 'date' and 'keyword' plus the 'value' score.
+        """
+        timeline_data = results.get("interest_over_time", {}).get("timeline_data", [])
+        rows = []
+        for item in timeline_data:
+            if "timestamp" in item:
+                date = pd.to_datetime(int(item["timestamp"]), unit="s")
+            else:
+                date = pd.to_datetime(item["date"])
+            rows.append((date.normalize(), keyword, item["values"][0]["extracted_value"]))
+        return pd.DataFrame(rows, columns=["date", "keyword", "value"])
+
+    def pull(self):
+        """
+        Fetch every (keyword, chunk) request concurrently.
+
+        Returns:
+            tuple: (DataFrame of long-format scores, list of (keyword, start, end) that failed).
+        """
+        if self.search_class is None:
+            from serpapi import GoogleSearch
+            self.search_class = GoogleSearch
+
+        requests_to_run = [(keyword, start, end) for keyword in self.keywords for start, end in self.chunks]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda request: self.fetch(*request), requests_to_run))
+
+        frames, missing = [], []
+        for (keyword, start, end), result in zip(requests_to_run, results):
+            if result is None:
+                missing.append((keyword, start, end))
+            else:
+                frames.append(self.parse_timeline(result, keyword))
+
+        if frames:
+            long_df = pd.concat(frames, ignore_index=True)
+        else:
+            long_df = pd.DataFrame(columns=["date", "keyword", "value"])
+        return long_df, missing
+
+    def to_table(self, long_df):
+        """
+        Pivot long-format scores into one date x keyword table.
+
+        Args:
+            long_df (DataFrame): Output of pull().
+
+        Returns:
+            DataFrame: One row per date and one column per keyword.
+        """
+        long_df = long_df.drop_duplicates(subset=["date", "keyword"], keep="first")
+        table = long_df.pivot(index="date", columns="keyword", values="value")
+        table = table.reindex(columns=self.keywords).sort_index()
+        table.index.name = "date"
+        table.columns.name = None
+        return table.reset_index()
+
+    def run(self, output_csv=DEFAULT_OUTPUT_CSV):
+        """
+        Run the pull and save the date x keyword table.
+
+        Args:
+            output_csv (str): Path of the output CSV.
+
+        Returns:
+            list: (keyword, start, end) requests still missing; re-run to resume them.
+        """
+        print(f"Pulling {len(self.keywords)} keywords over {len(self.chunks)} date chunks...")
+        long_df, missing = self.pull()
+        table = self.to_table(long_df)
+
+        tmp_path = f"{output_csv}.tmp"
+        table.to_csv(tmp_path, index=False, date_format="%Y-%m-%d")
+        os.replace(tmp_path, output_csv)
+
+        print(f"Saved {len(table)} dates to {output_csv} ({self.requests_made} API calls made).")
+        if missing:
+            print(f"{len(missing)} requests are missing; run again to resume:")
+            for keyword, start, end in missing:
+                print(f"  '{keyword}' {start} to {end}")
+        return missing
+
+
+if __name__ == "__main__":
+    keywords = ["crypto crash", "crypto to buy now", "buy AVAX"]  # List of search keywords
+    date_ranges = [("2020-09-19", "2024-12-06")]  # (start, end) pairs to pull
+    offline = False  # Use the local GoogleSearch stub instead of the live API
+
+    search_class = None
+    if offline:
+        from stub_search import StubGoogleSearch
+        search_class = StubGoogleSearch
+
+    puller = SerpTrendsPuller(keywords, date_ranges=date_ranges, max_workers=4,
+                              max_requests=100, search_class=search_class)
+    puller.run()
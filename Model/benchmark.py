@@ -0,0 +1,390 @@
+import os
+import re
+import sys
+import csv
+import json
+import time
+import argparse
+import platform
+import statistics
+import warnings
+import tempfile
+import tracemalloc
+import importlib.util
+import numpy as np
+import pandas as pd
+
+# Keep TensorFlow on the CPU and quiet, so results are comparable across machines
+os.environ.setdefault('CUDA_VISIBLE_DEVICES', '-1')
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+# preprocess_data inserts one column at a time; the resulting warning would drown the report
+warnings.simplefilter('ignore', pd.errors.PerformanceWarning)
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_SCRIPT = os.path.join(MODEL_DIR, 'model1.0.py')
+SCHEMA_CSV = os.path.join(MODEL_DIR, 'merged_combined_final.csv')
+DEFAULT_BASELINE = os.path.join(MODEL_DIR, 'benchmark_baseline.json')
+
+# name: (rows, pandas frequency of the synthetic date column, rows fed to window and later stages)
+# Windowing is a per-row Python loop that also materializes rows x 7 x features values,
+# so minute scales window only their most recent rows; a full 1M-row window would take
+# over half an hour and several GB per run.
+SCALES = {
+    'daily': (1_500, 'D', None),
+    'hourly': (36_000, 'h', None),
+    'minute-1m': (1_000_000, 'min', 36_000),
+    'minute-3m': (3_000_000, 'min', 36_000),
+}
+DEFAULT_SCALES = ['daily', 'hourly']
+STAGES = ['load', 'preprocess', 'window', 'to_arrays', 'train_step', 'predict']
+# TensorFlow allocates natively, so tracemalloc sees almost nothing of these stages
+NATIVE_STAGES = {'train_step', 'predict'}
+TARGET_COL = 'AVAXUSDT_close'
+WINDOW = 7
+BATCH_SIZE = 32
+
+
+def load_model_module():
+    """
+    Import Model/model1.0.py as a module without running its training script.
+    """
+    spec = importlib.util.spec_from_file_location('model', MODEL_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_schema():
+    """
+    Read the column names of the production dataset.
+
+    Returns:
+        list: Column names of merged_combined_final.csv, starting with 'date'.
+    """
+    with open(SCHEMA_CSV, newline='', encoding='utf-8') as file:
+        return next(csv.reader(file))
+
+
+def make_synthetic_frame(columns, rows, freq, seed=42):
+    """
+    Generate a frame with the production columns and plausible values.
+
+    Price-like columns follow a random walk, trend scores are integers in
+    0-100 and about 2% of the values are missing, so preprocess_data has
+    gaps to fill just like the real data.
+
+    Args:
+        columns (list): Column names, the first being 'date'.
+        rows (int): Number of rows.
+        freq (str): Pandas frequency of the date column ('D', 'h', 'min').
+        seed (int): Random seed.
+
+    Returns:
+        DataFrame: The synthetic dataset.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2020-09-19', periods=rows, freq=freq)
+    date_format = '%Y-%m-%d' if freq == 'D' else '%Y-%m-%d %H:%M:%S'
+    data = {'date': dates.strftime(date_format)}
+
+    # In the production file every column after FFRate is a search keyword
+    first_keyword = columns.index('FFRate') + 1 if 'FFRate' in columns else len(columns)
+    for i, col in enumerate(columns[1:], start=1):
+        if i >= first_keyword:
+            values = rng.integers(0, 101, rows).astype(np.float64)
+        else:
+            steps = rng.normal(0, 0.01, rows)
+            values = 100 * np.exp(np.cumsum(steps))
+        values[rng.random(rows) < 0.02] = np.nan
+        data[col] = values
+    return pd.DataFrame(data)
+
+
+def read_rss_mb(field):
+    """
+    Read a memory field ('VmRSS' or 'VmHWM') of this process from /proc, in MB.
+
+    Returns:
+        float: The value, or None where /proc is unavailable.
+    """
+    try:
+        with open('/proc/self/status', encoding='utf-8') as file:
+            match = re.search(rf'^{field}:\s+(\d+) kB', file.read(), re.MULTILINE)
+    except OSError:
+        return None
+    return int(match.group(1)) / 1024 if match else None
+
+
+def reset_peak_rss():
+    """
+    Reset the process RSS high-water mark (VmHWM) so the next peak belongs to one stage.
+
+    Returns:
+        bool: True if the kernel accepted the reset.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='utf-8') as file:
+            file.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def measure(func, repeat, track_memory, trace_heap=True):
+    """
+    Time a stage and optionally record its memory use.
+
+    Two memory figures are kept. peak_mb is the Python heap peak seen by
+    tracemalloc, measured in an extra untimed run and compared against the
+    baseline. rss_mb is how far the process RSS rose above its starting
+    point during the first timed run; it includes native (TensorFlow)
+    allocations but also depends on how much freed memory the allocator
+    kept from earlier stages, so it is reported for information only.
+
+    Args:
+        func (callable): The stage, called without arguments.
+        repeat (int): Number of timed runs; the median is reported.
+        track_memory (bool): Record memory use at all.
+        trace_heap (bool): Record the tracemalloc peak (off for native stages).
+
+    Returns:
+        tuple: (result of the last run, seconds, peak MB or None, RSS growth MB or None).
+    """
+    peak_mb = None
+    if track_memory and trace_heap:
+        tracemalloc.start()
+        func()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+
+    rss_mb = None
+    timings = []
+    for i in range(repeat):
+        measure_rss = track_memory and i == 0 and reset_peak_rss()
+        rss_before = read_rss_mb('VmRSS') if measure_rss else None
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+        if rss_before is not None:
+            rss_mb = max(read_rss_mb('VmHWM') - rss_before, 0.0)
+    return result, statistics.median(timings), peak_mb, rss_mb
+
+
+def run_scale(model_module, columns, scale, stages, repeat, track_memory):
+    """
+    Run the selected pipeline stages on one synthetic dataset size.
+
+    Args:
+        model_module (module): The imported model1.0.py.
+        columns (list): Production column names.
+        scale (str): Key of SCALES.
+        stages (list): Stages to time; earlier stages still run untimed when needed.
+        repeat (int): Timed runs per stage.
+        track_memory (bool): Record peak memory per stage.
+
+    Returns:
+        dict: stage -> {'seconds': float, 'peak_mb': float or None, 'rss_mb': float or None}.
+    """
+    rows, freq, window_rows = SCALES[scale]
+    print(f"[{scale}] generating {rows:,} synthetic rows...")
+    if window_rows is not None and STAGES.index('window') <= max(STAGES.index(stage) for stage in stages):
+        print(f"[{scale}] window and later stages use the last {window_rows:,} rows")
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_file = os.path.join(tmp_dir, 'synthetic.csv')
+        make_synthetic_frame(columns, rows, freq).to_csv(csv_file, index=False)
+
+        state = {}
+        last_stage = max(STAGES.index(stage) for stage in stages)
+
+        def load():
+            return model_module.load_data(csv_file)
+
+        def preprocess():
+            return model_module.preprocess_data(state['load'], TARGET_COL)[0]
+
+        def window():
+            normalized_df = state['preprocess']
+            if window_rows is not None:
+                normalized_df = normalized_df.iloc[-window_rows:]
+            return model_module.df_to_windowed_df_all_features(normalized_df, TARGET_COL, n=WINDOW)
+
+        def to_arrays():
+            return model_module.windowed_df_to_date_X_y(state['window'], n=WINDOW)
+
+        def train_step():
+            _, X, y = state['to_arrays']
+            return model.train_on_batch(X[:BATCH_SIZE], y[:BATCH_SIZE])
+
+        def predict():
+            _, X, _ = state['to_arrays']
+            return model.predict(X[int(len(X) * 0.8):], batch_size=BATCH_SIZE, verbose=0)
+
+        stage_funcs = {
+            'load': load, 'preprocess': preprocess, 'window': window,
+            'to_arrays': to_arrays, 'train_step': train_step, 'predict': predict
+        }
+
+        model = None
+        for stage in STAGES[:last_stage + 1]:
+            # Run the TensorFlow stages once untimed so graph tracing is not measured
+            if stage == 'train_step':
+                model_module.tf.random.set_seed(42)
+                model = model_module.build_model(state['to_arrays'][1].shape[2], n=WINDOW)
+                train_step()
+            elif stage == 'predict':
+                predict()
+
+            if stage in stages:
+                state[stage], seconds, peak_mb, rss_mb = measure(
+                    stage_funcs[stage], repeat, track_memory, trace_heap=stage not in NATIVE_STAGES
+                )
+                results[stage] = {'seconds': seconds, 'peak_mb': peak_mb, 'rss_mb': rss_mb}
+                memory = f", heap peak {peak_mb:.1f} MB" if peak_mb is not None else ""
+                memory += f", RSS +{rss_mb:.1f} MB" if rss_mb is not None else ""
+                print(f"[{scale}] {stage:<10} {seconds:9.4f} s{memory}")
+            else:
+                state[stage] = stage_funcs[stage]()
+
+    return results
+
+
+def compare(results, baseline, time_threshold, memory_threshold, slack_seconds):
+    """
+    Compare results with a stored baseline.
+
+    A stage regresses on time when it is slower than the baseline by more
+    than time_threshold and by more than slack_seconds, so run-to-run jitter
+    on short stages does not trip the check.
+
+    Args:
+        results (dict): scale -> stage -> metrics, as returned by run_scale.
+        baseline (dict): A previously saved results file.
+        time_threshold (float): Allowed relative slowdown (0.5 = 50%).
+        memory_threshold (float): Allowed relative growth of the tracemalloc peak.
+            RSS growth is informational and never gated.
+        slack_seconds (float): Allowed absolute slowdown on top of the relative one.
+
+    Returns:
+        list: Human readable descriptions of every regression.
+    """
+    regressions = []
+    for scale, stages in results.items():
+        for stage, metrics in stages.items():
+            base = baseline.get('results', {}).get(scale, {}).get(stage)
+            if base is None:
+                continue
+
+            base_seconds, seconds = base['seconds'], metrics['seconds']
+            if seconds > base_seconds * (1 + time_threshold) + slack_seconds:
+                regressions.append(
+                    f"{scale}/{stage}: {seconds:.4f} s vs baseline {base_seconds:.4f} s "
+                    f"(+{100 * (seconds / base_seconds - 1):.0f}%)"
+                )
+
+            base_mb, peak_mb = base.get('peak_mb'), metrics.get('peak_mb')
+            if stage in NATIVE_STAGES:
+                continue  # Older baselines may hold meaningless tracemalloc peaks for these
+            if base_mb and peak_mb is not None and peak_mb > base_mb * (1 + memory_threshold):
+                regressions.append(
+                    f"{scale}/{stage}: peak {peak_mb:.1f} MB vs baseline {base_mb:.1f} MB "
+                    f"(+{100 * (peak_mb / base_mb - 1):.0f}%)"
+                )
+    return regressions
+
+
+def environment_differences(report, baseline):
+    """
+    List the machine and library differences between a report and the baseline.
+
+    Returns:
+        list: 'section.key: baseline -> current' strings; empty when they match.
+    """
+    differences = []
+    for section in ('machine', 'versions'):
+        current, saved = report.get(section, {}), baseline.get(section, {})
+        for key in sorted(set(current) | set(saved)):
+            if current.get(key) != saved.get(key):
+                differences.append(f"{section}.{key}: {saved.get(key)} -> {current.get(key)}")
+    return differences
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the model1.0.py pipeline on synthetic data.")
+    parser.add_argument('--scales', default=','.join(DEFAULT_SCALES),
+                        help=f"Comma separated scales from: {', '.join(SCALES)}")
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"Comma separated stages from: {', '.join(STAGES)}")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per stage (median is kept)")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc peak memory run")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the baseline")
+    parser.add_argument('--time-threshold', type=float, default=0.50, help="Allowed relative slowdown")
+    parser.add_argument('--memory-threshold', type=float, default=0.20, help="Allowed relative memory growth")
+    parser.add_argument('--slack-seconds', type=float, default=0.10,
+                        help="Allowed absolute slowdown on top of --time-threshold")
+    parser.add_argument('--ignore-environment', action='store_true',
+                        help="Compare even if the machine or library versions differ from the baseline")
+    parser.add_argument('--output', help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    scales = [scale.strip() for scale in args.scales.split(',') if scale.strip()]
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    unknown = [name for name in scales if name not in SCALES] + [name for name in stages if name not in STAGES]
+    if unknown:
+        parser.error(f"Unknown scale or stage: {', '.join(unknown)}")
+
+    model_module = load_model_module()
+    columns = read_schema()
+    results = {
+        scale: run_scale(model_module, columns, scale, stages, args.repeat, not args.no_memory)
+        for scale in scales
+    }
+
+    report = {
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                    'processor': platform.processor()},
+        'versions': {'numpy': np.__version__, 'pandas': pd.__version__,
+                     'tensorflow': model_module.tf.__version__},
+        'scales': {scale: {'rows': SCALES[scale][0], 'window_rows': SCALES[scale][2]} for scale in scales},
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+
+    differences = environment_differences(report, baseline)
+    if differences:
+        print("Environment differs from the baseline:")
+        for difference in differences:
+            print(f"  {difference}")
+        if not args.ignore_environment:
+            print("Skipping the comparison; re-save the baseline or pass --ignore-environment.")
+            return 0
+
+    regressions = compare(results, baseline, args.time_threshold, args.memory_threshold, args.slack_seconds)
+    if regressions:
+        print("Regressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
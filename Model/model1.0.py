@@ -1,3 +1,6 @@
+import os
+import sys
+import json
 import pandas as pd
 import datetime
 import matplotlib.pyplot as plt
@@ -17,10 +20,12 @@ import random
 seed_value = 42
 np.random.seed(seed_value)
 
-# Load dataset
-df = pd.read_csv('merged_combined_final.csv')
+# Feature artifacts written by Data/dataset_builder.py
+FEATURES_MANIFEST = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Data', 'features', 'manifest.json'
+)
 
-# Drop specified columns
+# Columns left out of the feature set
 columns_to_drop = [
     'AVAXUSDT_1day_change', 'AVAXUSDT_2day_change', 'AVAXUSDT_3day_change',
     'AVAXUSDT_4day_change', 'AVAXUSDT_5day_change', 'AVAXUSDT_6day_change',
@@ -32,22 +37,47 @@ columns_to_drop = [
     'BTCUSDT_6day_change', 'BTCUSDT_7day_change', 'BTCUSDT_yesterday_change',
     'crypto to buy now', 'TargetVal', 'crypto crash', 'BTC_SMA'
 ]
-df = df.drop(columns=columns_to_drop, errors='ignore')
 
 # Convert date column to datetime
 def str_to_datetime(s):
     if pd.isna(s):
         return None
     try:
-        split = str(s).split('-')
+        date_part, _, time_part = str(s).partition(' ')
+        split = date_part.split('-')
         year, month, day = int(split[0]), int(split[1]), int(split[2])
-        return datetime.datetime(year=year, month=month, day=day)
+        parsed = datetime.datetime(year=year, month=month, day=day)
+        if time_part:  # Intraday rows carry an 'HH:MM:SS' time after the date
+            hour, minute, second = (int(part) for part in time_part.split(':'))
+            parsed = parsed.replace(hour=hour, minute=minute, second=second)
+        return parsed
     except Exception as e:
         print(f"Invalid date format: {s}, Error: {e}")
         return None
 
-df['date'] = df['date'].apply(str_to_datetime)
-df.index = df.pop('date')
+# Pick the dataset to train on
+def resolve_dataset_path(manifest_path=FEATURES_MANIFEST):
+    """
+    Return the latest feature artifact listed in the builder's manifest,
+    or the hand-merged merged_combined_final.csv when nothing has been built.
+    """
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as file:
+            latest = json.load(file).get('latest')
+        if latest:
+            return os.path.join(os.path.dirname(manifest_path), latest)
+    return 'merged_combined_final.csv'
+
+# Load dataset
+def load_data(csv_file):
+    """
+    Load the merged dataset, drop unused columns and index it by date.
+    """
+    df = pd.read_csv(csv_file)
+    df = df.drop(columns=columns_to_drop, errors='ignore')
+    df['date'] = df['date'].apply(str_to_datetime)
+    df.index = df.pop('date')
+    return df
 
 # Handle missing values and normalize features
 def preprocess_data(dataframe, target_col):
@@ -78,10 +108,6 @@ def preprocess_data(dataframe, target_col):
     
     return normalized_df, scalers
 
-# Preprocess data
-target_col = 'AVAXUSDT_close'
-normalized_df, scalers = preprocess_data(df, target_col)
-
 # Generate windowed DataFrame
 def df_to_windowed_df_all_features(dataframe, target_col, n=7):
     """
@@ -118,8 +144,6 @@ def df_to_windowed_df_all_features(dataframe, target_col, n=7):
 
     return ret_df
 
-windowed_df = df_to_windowed_df_all_features(normalized_df, target_col=target_col, n=7)
-
 # Prepare data for LSTM
 def windowed_df_to_date_X_y(windowed_dataframe, n=7):
     df_as_np = windowed_dataframe.to_numpy()
@@ -130,73 +154,93 @@ def windowed_df_to_date_X_y(windowed_dataframe, n=7):
     Y = df_as_np[:, -2]
     return dates, X.astype(np.float32), Y.astype(np.float32)
 
-dates, X, y = windowed_df_to_date_X_y(windowed_df)
+# Build the LSTM model
+def build_model(n_features, n=7):
+    model = Sequential([
+        layers.Input((n, n_features)),
+        layers.LSTM(64),
+        layers.Dense(32, activation='relu'),
+        layers.Dense(64, activation='relu'),
+        layers.Dense(1)
+    ])
+    model.compile(loss='mse', optimizer=Adam(learning_rate=0.001), metrics=['mean_absolute_error'])
+    return model
+
+def main(csv_file=None):
+    csv_file = csv_file or resolve_dataset_path()
+    print(f"Loading dataset from {csv_file}")
+    df = load_data(csv_file)
 
-# Train/Validation/Test Split
-q_70 = int(len(dates) * 0.7)
-q_80 = int(len(dates) * 0.8)
+    # Preprocess data
+    target_col = 'AVAXUSDT_close'
+    normalized_df, scalers = preprocess_data(df, target_col)
 
-dates_train, X_train, y_train = dates[:q_70], X[:q_70], y[:q_70]
-dates_val, X_val, y_val = dates[q_70:q_80], X[q_70:q_80], y[q_70:q_80]
-dates_test, X_test, y_test = dates[q_80:], X[q_80:], y[q_80:]
+    windowed_df = df_to_windowed_df_all_features(normalized_df, target_col=target_col, n=7)
 
-# Build and Train LSTM Model
-model = Sequential([
-    layers.Input((7, X_train.shape[2])),
-    layers.LSTM(64),
-    layers.Dense(32, activation='relu'),
-    layers.Dense(64, activation='relu'),
-    layers.Dense(1)
-])
+    dates, X, y = windowed_df_to_date_X_y(windowed_df)
 
-model.compile(loss='mse', optimizer=Adam(learning_rate=0.001), metrics=['mean_absolute_error'])
+    # Train/Validation/Test Split
+    q_70 = int(len(dates) * 0.7)
+    q_80 = int(len(dates) * 0.8)
 
-model.fit(X_train, y_train, validation_data=(X_val, y_val), epochs=50)
+    dates_train, X_train, y_train = dates[:q_70], X[:q_70], y[:q_70]
+    dates_val, X_val, y_val = dates[q_70:q_80], X[q_70:q_80], y[q_70:q_80]
+    dates_test, X_test, y_test = dates[q_80:], X[q_80:], y[q_80:]
 
-# Predict and evaluate on the original scale
-predictions = model.predict(X_test)
+    # Build and Train LSTM Model
+    model = build_model(X_train.shape[2])
 
-dates_test = pd.to_datetime(dates_test)
+    model.fit(X_train, y_train, validation_data=(X_val, y_val), epochs=50)
 
-plt.figure(figsize=(12, 6))
-plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-plt.gca().xaxis.set_major_locator(mdates.DayLocator(interval=14))  # Adjust tick frequency
+    # Predict and evaluate on the original scale
+    predictions = model.predict(X_test)
 
-plt.plot(dates_test, y_test, label='Actual')
-plt.plot(dates_test, predictions, label='Predicted')
-plt.gcf().autofmt_xdate()  # Rotate and format dates
-plt.legend()
-plt.tight_layout()
-plt.show()
+    dates_test = pd.to_datetime(dates_test)
 
-mae_original_scale = mean_absolute_error(y_test, predictions)
+    plt.figure(figsize=(12, 6))
+    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    plt.gca().xaxis.set_major_locator(mdates.DayLocator(interval=14))  # Adjust tick frequency
 
-print(f"MAE on original scale: {mae_original_scale}")
+    plt.plot(dates_test, y_test, label='Actual')
+    plt.plot(dates_test, predictions, label='Predicted')
+    plt.gcf().autofmt_xdate()  # Rotate and format dates
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
 
-# Initialize variables
-TP, TN, FP, FN = 0, 0, 0, 0
+    mae_original_scale = mean_absolute_error(y_test, predictions)
 
-for i in range(1, int(0.2 * len(y_test))):
-    # Determine binary ground truth for y_test
-    y_test_binary = y_test[i] > y_test[i - 1]
-    # Determine binary predictions
-    binary_predictions = predictions[i] > y_test[i - 1]
-    
-    # Update
-    if y_test_binary and binary_predictions:
-        TP += 1  # True Positive
-    elif not y_test_binary and binary_predictions:
-        FP += 1  # False Positive
-    elif y_test_binary and not binary_predictions:
-        FN += 1  # False Negative
-    else:  
-        TN += 1  # True Negative
-
-# Calculate Precision and Recall
-precision = TP / (TP + FP) if (TP + FP) > 0 else 0
-recall = TP / (TP + FN) if (TP + FN) > 0 else 0
-
-# Calculate F1 Score
-f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-
-print(f"Precision: {precision:.2f}, Recall: {recall:.2f}, F1 Score: {f1:.2f}")
\ No newline at end of file
+    print(f"MAE on original scale: {mae_original_scale}")
+
+    # Initialize variables
+    TP, TN, FP, FN = 0, 0, 0, 0
+
+    for i in range(1, int(0.2 * len(y_test))):
+        # Determine binary ground truth for y_test
+        y_test_binary = y_test[i] > y_test[i - 1]
+        # Determine binary predictions
+        binary_predictions = predictions[i] > y_test[i - 1]
+
+        # Update
+        if y_test_binary and binary_predictions:
+            TP += 1  # True Positive
+        elif not y_test_binary and binary_predictions:
+            FP += 1  # False Positive
+        elif y_test_binary and not binary_predictions:
+            FN += 1  # False Negative
+        else:  
+            TN += 1  # True Negative
+
+    # Calculate Precision and Recall
+    precision = TP / (TP + FP) if (TP + FP) > 0 else 0
+    recall = TP / (TP + FN) if (TP + FN) > 0 else 0
+
+    # Calculate F1 Score
+    f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
+
+    print(f"Precision: {precision:.2f}, Recall: {recall:.2f}, F1 Score: {f1:.2f}")
+
+
+if __name__ == "__main__":
+    # An explicit CSV path overrides the builder's latest artifact
+    main(sys.argv[1] if len(sys.argv) > 1 else None)